@@ -7,6 +7,8 @@
     from neet.boolean.examples import MYELOID_LOGIC_EXPRESSIONS, MYELOID_TRUTH_TABLE
 """
 import re
+import numpy as np
+from itertools import product
 from neet.python import long
 from neet.exceptions import FormatError
 from .network import BooleanNetwork
@@ -33,6 +35,7 @@ class LogicNetwork(BooleanNetwork):
         :nosignatures:
 
         is_dependent
+        is_canalizing
         reduce_table
         read_table
         read_logic
@@ -166,27 +169,58 @@ class LogicNetwork(BooleanNetwork):
         :type source: int
         :return: whether the target node is dependent on the source
         """
-        sub_table = self.table[target]
-        if source not in sub_table[0]:  # No explicit dependency.
+        sources, conditions = self.table[target]
+        if source not in sources:  # No explicit dependency.
             return False
 
-        # Determine implicit dependency.
-        i = sub_table[0].index(source)
-        counter = {}
-        for state in sub_table[1]:
-            # State excluding source.
-            state_sans_source = state[:i] + state[i + 1:]
-            if long(state[i]) == 1:
-                counter[state_sans_source] = counter.get(
-                    state_sans_source, 0) + 1
-            else:
-                counter[state_sans_source] = counter.get(
-                    state_sans_source, 0) - 1
-
-        if any(counter.values()):  # States uneven.
-            return True
+        # Determine implicit dependency: the target depends on the source if
+        # flipping the source's state in some activating condition yields a
+        # condition which does not activate the target.
+        i = sources.index(source)
+        flipped = {'0': '1', '1': '0'}
+        for state in conditions:
+            if state[:i] + flipped[state[i]] + state[i + 1:] not in conditions:
+                return True
         return False
 
+    def is_canalizing(self, x, y):
+        """
+        Determine whether a given network edge is canalizing.
+
+        This overrides :meth:`neet.boolean.SensitivityMixin.is_canalizing`,
+        reading the result directly off of the truth table of node ``x``
+        rather than updating the network for every state of its inputs.
+
+        .. doctest:: logicnetwork
+
+            >>> net = LogicNetwork([((1, 2), {'01', '10'}),
+            ... ((0, 2), {'01', '10', '11'}),
+            ... ((0, 1), {'11'})])
+            >>> net.is_canalizing(0, 1)
+            False
+            >>> net.is_canalizing(1, 0)
+            True
+
+        :param x: target node's index
+        :type x: int
+        :param y: source node's index
+        :type y: int
+        :return: whether or not the edge ``(y,x)`` is canalizing; ``None`` if
+                 the edge does not exist
+        """
+        if x not in range(self.size) or y not in self.table[x][0]:
+            return None
+
+        sources, conditions = self.table[x]
+        i = sources.index(y)
+        # Each state of the source fixes half of the rows of the truth table.
+        # The edge is canalizing if, for either state, the target is
+        # activated by all or none of those rows.
+        half = 2**(len(sources) - 1)
+        on = sum(1 for state in conditions if state[i] == '1')
+        off = len(conditions) - on
+        return on in (0, half) or off in (0, half)
+
     def reduce_table(self):
         """
         Reduce truth table by removing input nodes which have no logic
@@ -264,6 +298,36 @@ class LogicNetwork(BooleanNetwork):
 
         return net_state
 
+    def _unsafe_transitions(self, index=None, pin=None, values=None):
+        # Every state is its own encoding, so the successors of all states can
+        # be computed bitwise, one node at a time, by matching the masked
+        # states against the node's encoded truth table.
+        states = np.arange(self.volume, dtype=np.int64)
+        transitions = states.copy()
+
+        if index is None:
+            indices = range(self.size)
+        else:
+            indices = [index]
+
+        if pin is None:
+            pin = []
+
+        for idx in indices:
+            if idx in pin:
+                continue
+            mask, condition = self._encoded_table[idx]
+            active = np.isin(states & mask, list(condition))
+            transitions &= ~(1 << idx)
+            transitions |= active.astype(np.int64) << idx
+
+        if values:
+            for k, v in values.items():
+                transitions &= ~(1 << k)
+                transitions += v << k
+
+        return transitions
+
     @classmethod
     def read_table(cls, table_path, reduced=False, metadata=None):
         """
@@ -520,20 +584,20 @@ class LogicNetwork(BooleanNetwork):
                     if item not in names:
                         raise FormatError("unknown component '{}'".format(item))
                     if item not in sub_nodes:
-                        expr_split[i] = '{' + str(len(sub_nodes)) + '}'
+                        expr_split[i] = 'x[{}]'.format(len(sub_nodes))
                         sub_nodes.append(item)
                     else:
-                        expr_split[i] = '{' + str(sub_nodes.index(item)) + '}'
+                        expr_split[i] = 'x[{}]'.format(sub_nodes.index(item))
                 else:
                     expr_split[i] = item.lower()
-            logic_expr = ' '.join(expr_split)
+            # Compile the expression once rather than once per input state.
+            logic_expr = eval('lambda x: ' + ' '.join(expr_split))
 
             indices = tuple([names.index(node) for node in sub_nodes])
 
-            for dec_state in range(2**len(sub_nodes)):
-                bin_state = '{0:0{1}b}'.format(dec_state, len(sub_nodes))
-                if eval(logic_expr.format(*bin_state)):
-                    conditions.add(bin_state)
+            for state in product((0, 1), repeat=len(sub_nodes)):
+                if logic_expr(state):
+                    conditions.add(''.join(map(str, state)))
 
             table.append((indices, conditions))
 
@@ -548,12 +612,7 @@ class LogicNetwork(BooleanNetwork):
         return set(self.table[index][0])
 
     def neighbors_out(self, index, *args, **kwargs):
-        outgoing_neighbors = set()
-        for i, incoming_neighbors in enumerate([row[0] for row in self.table]):
-            if index in incoming_neighbors:
-                outgoing_neighbors.add(i)
-
-        return outgoing_neighbors
+        return {i for i, (sources, _) in enumerate(self.table) if index in sources}
 
 
 BooleanNetwork.register(LogicNetwork)
@@ -9,6 +9,21 @@ from neet import UniformNetwork
 from neet.python import long
 from .sensitivity import SensitivityMixin
 import copy
+import numpy as np
+
+
+def _copier(state):
+    """
+    Get a function which copies states of the same type as ``state``.
+
+    Resolving this once, rather than calling :func:`copy.copy` on every state,
+    avoids its generic type dispatch in loops which copy many states.
+    """
+    if isinstance(state, np.ndarray):
+        return np.ndarray.copy
+    elif isinstance(state, list):
+        return list
+    return copy.copy
 
 
 class BooleanNetwork(SensitivityMixin, UniformNetwork):
@@ -136,8 +151,10 @@ class BooleanNetwork(SensitivityMixin, UniformNetwork):
         indices.sort()
         nindices = len(indices)
 
+        copier = _copier(state)
+
         if nindices == 0:
-            yield copy.copy(state)
+            yield copier(state)
         elif indices[0] < 0 or indices[-1] >= size:
             raise IndexError('index out of range')
         elif nindices == size:
@@ -145,9 +162,9 @@ class BooleanNetwork(SensitivityMixin, UniformNetwork):
                 yield state
         else:
 
-            initial = copy.copy(state)
+            initial = copier(state)
 
-            yield copy.copy(state)
+            yield copier(state)
             i = 0
             while i != nindices:
                 if state[indices[i]] == initial[indices[i]]:
@@ -155,7 +172,7 @@ class BooleanNetwork(SensitivityMixin, UniformNetwork):
                     for j in range(i):
                         state[indices[j]] = initial[indices[j]]
                     i = 0
-                    yield copy.copy(state)
+                    yield copier(state)
                 else:
                     i += 1
 
@@ -179,9 +196,10 @@ class BooleanNetwork(SensitivityMixin, UniformNetwork):
         """
         if state not in self:
             raise ValueError('state is not in state space')
+        copier = _copier(state)
         neighbors = [None] * self.size
         for i in range(self.size):
-            neighbors[i] = copy.copy(state)
+            neighbors[i] = copier(state)
             neighbors[i][i] ^= 1
         return neighbors
 
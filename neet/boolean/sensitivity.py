@@ -82,6 +82,7 @@ class SensitivityMixin(object):
         .. seealso:: :func:`average_sensitivity`
         """
         encoder = self._unsafe_encode
+        update = self._unsafe_update
         distance = self.distance
         neighbors = self.hamming_neighbors(state)
 
@@ -93,7 +94,7 @@ class SensitivityMixin(object):
             if transitions is not None:
                 newState = transitions[encoder(neighbor)]
             else:
-                newState = self._unsafe_update(neighbor)
+                newState = update(neighbor)
             s += distance(newState, nextState)
 
         return s / self.size
@@ -153,6 +154,7 @@ class SensitivityMixin(object):
 
         # list Hamming neighbors (in order!)
         encoder = self._unsafe_encode
+        update = self._unsafe_update
         neighbors = self.hamming_neighbors(state)
 
         nextState = self.update(state)
@@ -162,7 +164,7 @@ class SensitivityMixin(object):
             if transitions is not None:
                 newState = transitions[encoder(neighbor)]
             else:
-                newState = self._unsafe_update(neighbor)
+                newState = update(neighbor)
             Q[:, j] = [(nextState[i] + newState[i]) % 2 for i in range(N)]
 
         return Q
@@ -247,13 +249,15 @@ class SensitivityMixin(object):
                 raise(ValueError(msg))
 
             norm = np.sum(weights)
+            difference_matrix = self.difference_matrix
             for i, state in enumerate(states):
-                Q += weights[i] * self.difference_matrix(state, trans) / norm
+                Q += weights[i] * difference_matrix(state, trans) / norm
 
         else:  # make use of sparse connectivity to be more efficient
             state0 = np.zeros(N, dtype=int)
 
             subspace = self.subspace
+            update = self._unsafe_update
 
             for i in range(N):
                 nodesInfluencingI = list(self.neighbors_in(i))
@@ -266,10 +270,10 @@ class SensitivityMixin(object):
                     for state in otherNodeStates:
                         iState = state[i]
                         state[j] = 0
-                        jOffNext = self._unsafe_update(state, index=i)[i]
+                        jOffNext = update(state, index=i)[i]
                         state[i] = iState
                         state[j] = 1
-                        jOnNext = self._unsafe_update(state, index=i)[i]
+                        jOnNext = update(state, index=i)[i]
                         # are the results different?
                         Q[i, j] += (jOffNext + jOnNext) % 2
                     Q[i, j] /= float(len(otherNodeStates))
@@ -329,6 +333,7 @@ class SensitivityMixin(object):
             jindex = nodesInfluencingI.index(y)
 
             subspace = self.subspace
+            update = self._unsafe_update
 
             # for every state of other nodes, does j determine i?
             otherNodes = list(copy.copy(nodesInfluencingI))
@@ -344,9 +349,9 @@ class SensitivityMixin(object):
 
                 # first hold j off
                 if jOffForced:
-                    jOff = copy.copy(state)
+                    jOff = state.copy()
                     jOff[y] = 0
-                    jOffNext = self._unsafe_update(jOff, index=x)[x]
+                    jOffNext = update(jOff, index=x)[x]
                     if jOffForcedValue is None:
                         jOffForcedValue = jOffNext
                     elif jOffForcedValue != jOffNext:
@@ -355,9 +360,9 @@ class SensitivityMixin(object):
 
                 # now hold j on
                 if jOnForced:
-                    jOn = copy.copy(state)
+                    jOn = state.copy()
                     jOn[y] = 1
-                    jOnNext = self._unsafe_update(jOn, index=x)[x]
+                    jOnNext = update(jOn, index=x)[x]
                     if jOnForcedValue is None:
                         jOnForcedValue = jOnNext
                     elif jOnForcedValue != jOnNext:
@@ -367,7 +372,6 @@ class SensitivityMixin(object):
                 stateindex += 1
 
             # if we have checked all states, then the edge must be forcing
-            # print "jOnForced,jOffForced",jOnForced,jOffForced
             return jOnForced or jOffForced
 
     def canalizing_edges(self):
@@ -387,10 +391,11 @@ class SensitivityMixin(object):
 
         .. seealso:: :func:`is_canalizing`, :func:`canalizing_nodes`
         """
+        is_canalizing = self.is_canalizing
         canalizing_edges = set()
         for x in range(self.size):
             for y in self.neighbors_in(x):
-                if self.is_canalizing(x, y):
+                if is_canalizing(x, y):
                     canalizing_edges.add((x, y))
         return canalizing_edges
 
@@ -26,7 +26,6 @@ See :class:`LandscapeMixin.expound` for a list of such properties.
 """
 import networkx as nx
 import numpy as np
-import pyinform as pi
 
 
 class LandscapeData(object):
@@ -103,6 +102,7 @@ class LandscapeMixin:
        :nosignatures:
 
        landscape
+       _unsafe_transitions
        clear_landscape
        landscape_data
        transitions
@@ -188,15 +188,9 @@ class LandscapeMixin:
 
         self.__expounded = False
 
-        update = self._unsafe_update
-        encode = self._unsafe_encode
-
-        transitions = np.empty(self.volume, dtype=np.int)
-        for i, state in enumerate(self):
-            transitions[i] = encode(update(state,
-                                           index=self.__index,
-                                           pin=self.__pin,
-                                           values=self.__values))
+        transitions = self._unsafe_transitions(index=self.__index,
+                                               pin=self.__pin,
+                                               values=self.__values)
 
         self.clear_landscape()
         self.__landscape_data.transitions = transitions
@@ -204,6 +198,57 @@ class LandscapeMixin:
 
         return self
 
+    def _unsafe_transitions(self, index=None, pin=None, values=None):
+        """
+        Compute the encoded successor of every state of the network.
+
+        The resulting array is indexed by the encoded initial state, exactly
+        as :attr:`transitions`. The arguments are as in :meth:`landscape`, and
+        are passed along to :meth:`neet.Network._unsafe_update`.
+
+        .. doctest:: landscape
+
+            >>> s_pombe._unsafe_transitions()
+            array([  2,   2, 130, 130,   4,   0, 128, 128,   8,   0, 128, 128,  12,
+                     0, 128, 128, 256, 256, 384, 384, 260, 256, 384, 384, 264, 256,
+                   ...
+                   208, 208, 336, 336, 464, 464, 340, 336, 464, 464, 344, 336, 464,
+                   464, 348, 336, 464, 464])
+
+        The default implementation updates each state in turn and encodes all
+        of the successors at once. Classes which can update every state of the
+        space in bulk can overload this method to avoid the per-state updates.
+
+        .. Note::
+
+            This method is **not** safe. Like
+            :meth:`neet.Network._unsafe_update`, it performs no checks on its
+            arguments.
+
+        :param index: the index to update (or None)
+        :param pin: the indices to pin during update (or None)
+        :param values: a dictionary of index-value pairs to set after update
+        :return: a :class:`numpy.ndarray` of state transitions
+        """
+        update = self._unsafe_update
+        encode = self._unsafe_batch_encode
+
+        # Update the states a block at a time, encoding each block of
+        # successors at once. This bounds the memory used to hold the updated
+        # states, however large the volume. The block shares the int64 dtype
+        # of the place values so that encoding it does not copy it.
+        block_size = min(self.volume, 2**16)
+        block = np.empty((block_size, self.size), dtype=np.int64)
+        transitions = np.empty(self.volume, dtype=np.int64)
+        states = iter(self)
+        for start in range(0, self.volume, block_size):
+            stop = min(start + block_size, self.volume)
+            for i in range(stop - start):
+                block[i] = update(next(states), index=index, pin=pin,
+                                  values=values)
+            transitions[start:stop] = encode(block[:stop - start])
+        return transitions
+
     def clear_landscape(self):
         """
         Clear the landscape's data and graph from memory.
@@ -689,8 +734,11 @@ class LandscapeMixin:
         if not self.__landscaped:
             self.landscape()
         if self.__landscape_graph is None:
-            self.__landscape_graph = nx.DiGraph(
-                list(enumerate(self.__landscape_data.transitions)), **kwargs)
+            transitions = self.__landscape_data.transitions.tolist()
+            graph = nx.DiGraph(**kwargs)
+            graph.add_nodes_from(range(self.volume))
+            graph.add_edges_from(zip(range(self.volume), transitions))
+            self.__landscape_graph = graph
         elif (len(kwargs) != 0):
             self.__landscape_graph.graph.update(kwargs)
         return self.__landscape_graph
@@ -797,9 +845,11 @@ class LandscapeMixin:
                 path[i] = trans[path[i - 1]]
         else:
             path = [init]
+            seen = {init}
             state = trans[init]
-            while state not in path:
+            while state not in seen:
                 path.append(state)
+                seen.add(state)
                 state = trans[state]
 
         if not encode:
@@ -871,18 +921,19 @@ class LandscapeMixin:
             raise ValueError("number of steps must be positive, non-zero")
 
         trans = self.__landscape_data.transitions
-        decode = self.decode
-        decoded_trans = [decode(state) for state in trans]
+        # Decode every state at once, one node per row, so that column i is
+        # the state encoded as i
+        encoded = np.arange(self.volume)
+        states = self._unsafe_batch_decode(encoded).T
 
         shape = (self.size, self.volume, timesteps + 1)
-        series = np.empty(shape, dtype=np.int)
+        series = np.empty(shape, dtype=np.int_)
 
-        for index, init in enumerate(self):
-            k = index
-            series[:, index, 0] = init[:]
-            for time in range(1, timesteps + 1):
-                series[:, index, time] = decoded_trans[k][:]
-                k = trans[k]
+        # Advance every initial state at once, one time step at a time
+        series[:, :, 0] = states
+        for time in range(1, timesteps + 1):
+            encoded = trans[encoded]
+            series[:, :, time] = states[:, encoded]
 
         return series
 
@@ -918,141 +969,106 @@ class LandscapeMixin:
             self.landscape()
 
         # Get the state transitions
-        trans = self.__landscape_data.transitions
-        # Create an array to store whether a given state has visited
-        visited = np.zeros(self.volume, dtype=np.bool)
-        # Create an array to store which attractor basin each state is in
-        basins = np.full(self.volume, -1, dtype=np.int)
-        # Create an array to store the in-degree of each state
-        in_degrees = np.zeros(self.volume, dtype=np.int)
+        transitions = self.__landscape_data.transitions
+        # Count the in-degree of each state in a single pass
+        in_degrees = np.bincount(transitions, minlength=self.volume)
+        # Read the transitions one at a time as Python integers, without
+        # boxing the whole array up front
+        successor = transitions.item
+        # Create an array to store which attractor basin each state is in.
+        # This doubles as the record of which states have been visited: a
+        # state is unvisited while its basin is UNVISITED, and is ON_PATH
+        # while it is on the stack awaiting a basin.
+        UNVISITED, ON_PATH = -1, -2
+        basins = np.full(self.volume, UNVISITED, dtype=np.int_)
         # Create an array to store the height of each state
-        heights = np.zeros(self.volume, dtype=np.int)
+        heights = np.zeros(self.volume, dtype=np.int_)
         # Create an array to store the recurrence time of each state
-        recurrence_times = np.zeros(self.volume, dtype=np.int)
+        recurrence_times = np.zeros(self.volume, dtype=np.int_)
         # Create a counter to keep track of how many basins have been visited
         basin_number = 0
-        # Create a list of basin sizes
-        basin_sizes = []
         # Create a list of attractor cycles
         attractors = []
         # Create a list of attractor lengths
         attractor_lengths = []
-
+        # Create a stack to store the states so far visited. The stack is
+        # reused for every initial state, and only grows when a path is longer
+        # than any walked before it.
+        state_stack = []
         # Start at state 0
-        initial_state = 0
+        volume, initial_state = self.volume, 0
         # While the initial state is a state of the system
-        while initial_state < len(trans):
-            # Create a stack to store the state so far visited
-            state_stack = []
-            # Create a array to store the states in the attractor cycle
-            cycle = []
-            # Create a flag to signify whether the current state is part of
-            # the cycle
-            in_cycle = False
+        while initial_state < volume:
+            # Empty the stack
+            sp = 0
             # Set the current state to the initial state
             state = initial_state
-            # Store the next state and terminus variables to the next state
-            terminus = next_state = trans[state]
-            # Set the visited flag of the current state
-            visited[state] = True
-            # Increment in-degree
-            in_degrees[next_state] += 1
-            # While the next state hasn't been visited
-            while not visited[next_state]:
+            # Push states onto the stack until we reach a visited state
+            while basins[state] == UNVISITED:
+                # Mark the current state as visited
+                basins[state] = ON_PATH
                 # Push the current state onto the stack
-                state_stack.append(state)
-                # Set the current state to the next state
-                state = next_state
-                # Update the terminus and next_state variables
-                terminus = next_state = trans[state]
-                # Update the visited flag for the current state
-                visited[state] = True
-                # Increment in-degree
-                in_degrees[next_state] += 1
-
-            # If the next state hasn't been assigned a basin yet
-            if basins[next_state] == -1:
+                if sp == len(state_stack):
+                    state_stack.append(state)
+                else:
+                    state_stack[sp] = state
+                sp += 1
+                # Move on to the next state
+                state = successor(state)
+            # If the walk ran into itself, we've found a new attractor
+            if basins[state] == ON_PATH:
                 # Set the current basin to the basin number
                 basin = basin_number
                 # Increment the basin number
                 basin_number += 1
-                # Add a new basin size
-                basin_sizes.append(0)
-                # Add a new attractor length
-                attractor_lengths.append(1)
-                # Add the current state to the attractor cycle
-                cycle.append(state)
-                # Set the current state's recurrence time
-                recurrence_times[state] = 0
-                # We're still in the cycle until the current state is equal to
-                # the terminus
-                in_cycle = (terminus != state)
+                # The cycle is the top of the stack, down to the first visit
+                # of the repeated state
+                top = state_stack.index(state, 0, sp)
+                length = sp - top
+                # Record the cycle, starting from the last state visited
+                cycle = state_stack[top:sp]
+                attractors.append(np.asarray(cycle[::-1], dtype=np.int_))
+                attractor_lengths.append(length)
+                # Every state of the cycle recurs after a full cycle
+                for cycle_state in cycle:
+                    basins[cycle_state] = basin
+                    recurrence_times[cycle_state] = length - 1
+                # The transient states lead into the cycle
+                height, recurrence_time = 0, length - 1
             else:
-                # Set the current basin to the basin of next_state
-                basin = basins[next_state]
-                # Set the state's height to one greater than the next state's
-                heights[state] = heights[next_state] + 1
-                # Set the state's recurrence time to one greater than the next
-                # state's
-                recurrence_times[state] = recurrence_times[next_state] + 1
-
-            # Set the basin of the current state
-            basins[state] = basin
-            # Increment the basin size
-            basin_sizes[basin] += 1
-
-            # While we still have states on the stack
-            while len(state_stack) != 0:
-                # Save the current state as the next state
-                next_state = state
-                # Pop the current state off of the top of the stack
-                state = state_stack.pop()
-                # Set the basin of the current state
+                # Set the current basin to the basin of the visited state
+                basin = basins[state]
+                # The whole walk leads into the visited state
+                top = sp
+                height = heights[state]
+                recurrence_time = recurrence_times[state]
+            # Pop the transient states off of the stack; each is one step
+            # further from the attractor than the state above it
+            while top != 0:
+                top -= 1
+                state = state_stack[top]
+                height += 1
+                recurrence_time += 1
                 basins[state] = basin
-                # Increment the basin_size
-                basin_sizes[basin] += 1
-                # If we're still in the cycle
-                if in_cycle:
-                    # Add the current state to the attractor cycle
-                    cycle.append(state)
-                    # Increment the current attractor length
-                    attractor_lengths[basin] += 1
-                    # We're still in the cycle until the current state is
-                    # equal to the terminus
-                    in_cycle = (terminus != state)
-                    # Set the cycle state's recurrence times
-                    if not in_cycle:
-                        for cycle_state in cycle:
-                            rec_time = attractor_lengths[basin] - 1
-                            recurrence_times[cycle_state] = rec_time
-                else:
-                    # Set the state's height to one create than the next
-                    # state's
-                    heights[state] = heights[next_state] + 1
-                    # Set the state's recurrence time to one greater than the
-                    # next state's
-                    recurrence_times[state] = recurrence_times[next_state] + 1
-
+                heights[state] = height
+                recurrence_times[state] = recurrence_time
             # Find the next unvisited initial state
-            while initial_state < len(visited) and visited[initial_state]:
+            while initial_state < volume and basins[initial_state] != UNVISITED:
                 initial_state += 1
-
-            # If the cycle isn't empty, append it to the attractors list
-            if len(cycle) != 0:
-                attractors.append(np.asarray(cycle, dtype=np.int))
-
         data = self.__landscape_data
 
         data.basins = basins
-        data.basin_sizes = np.asarray(basin_sizes)
+        # Count the states in each basin in a single pass
+        data.basin_sizes = np.bincount(basins, minlength=basin_number)
         data.attractors = np.asarray(attractors)
         data.attractor_lengths = np.asarray(attractor_lengths)
         data.in_degrees = in_degrees
         data.heights = heights
         data.recurrence_times = np.asarray(recurrence_times)
 
-        dist = pi.Dist(self.__landscape_data.basin_sizes)
-        data.basin_entropy = pi.shannon.entropy(dist, b=2)
+        # Every basin holds at least one state, so no probability is zero
+        probs = data.basin_sizes / float(self.volume)
+        data.basin_entropy = float(np.sum(probs * -np.log2(probs)))
 
         self.__expounded = True
 
@@ -23,6 +23,7 @@ decode states as integer values. In other words, these classes provide an
 interface for accessing the *unstructured* set of states of the network, with
 no dynamical information.
 """
+import numpy as np
 from .python import long
 
 
@@ -41,6 +42,8 @@ class StateSpace(object):
        __iter__
        __contains__
        _unsafe_encode
+       _unsafe_batch_encode
+       _unsafe_batch_decode
        encode
        decode
 
@@ -267,6 +270,90 @@ class StateSpace(object):
 
         return encoded
 
+    def _unsafe_batch_encode(self, states):
+        """
+        Unsafely encode an array of states as integer values.
+
+        .. rubric:: Examples
+
+        .. doctest:: statespace
+
+           >>> space = StateSpace([2,3])
+           >>> space._unsafe_batch_encode([[1,1], [0,2]])
+           array([3, 4])
+
+        This is the vectorized counterpart of :meth:`_unsafe_encode`; each
+        state is encoded exactly as :meth:`_unsafe_encode` would encode it, but
+        all of the states are encoded in a single array operation.
+
+        .. doctest:: statespace
+
+           >>> space = StateSpace([2,3])
+           >>> space._unsafe_batch_encode(list(space))
+           array([0, 1, 2, 3, 4, 5])
+
+        .. Note::
+
+            Like :meth:`_unsafe_encode`, this method is **not** safe. It does
+            not ensure that the states are in fact in the space.
+
+        :param states: the states, one per row
+        :type states: list, numpy.ndarray
+        :returns: a :class:`numpy.ndarray` of the encoded states
+
+        :see: :meth:`_unsafe_encode`
+        """
+        places = np.cumprod([1] + self.shape[:-1], dtype=np.int64)
+        return np.dot(states, places)
+
+    def _unsafe_batch_decode(self, encoded):
+        """
+        Unsafely decode an array of integer-encoded states.
+
+        .. rubric:: Examples
+
+        .. doctest:: statespace
+
+           >>> space = StateSpace([2,3])
+           >>> space._unsafe_batch_decode([3, 4])
+           array([[1, 1],
+                  [0, 2]])
+
+        This is the vectorized counterpart of :meth:`decode`, and the inverse
+        of :meth:`_unsafe_batch_encode`; each row of the result is the state
+        that :meth:`decode` would produce.
+
+        .. doctest:: statespace
+
+           >>> space = StateSpace([2,3])
+           >>> space._unsafe_batch_decode(range(space.volume)).tolist() == list(space)
+           True
+           >>> space._unsafe_batch_encode(space._unsafe_batch_decode([3, 4]))
+           array([3, 4])
+
+        The states are computed one dimension at a time, so the result is a
+        transposed view of a contiguous ``(size, len(encoded))`` array;
+        ``.T`` gives the coordinates of all states one dimension per row.
+
+        .. Note::
+
+            Like :meth:`_unsafe_encode`, this method is **not** safe. It does
+            not ensure that the encoded states are in fact in the space.
+
+        :param encoded: the integer-encoded states
+        :type encoded: list, numpy.ndarray
+        :returns: a :class:`numpy.ndarray` of the decoded states, one per row
+
+        :see: :meth:`decode`, :meth:`_unsafe_batch_encode`
+        """
+        encoded = np.asarray(encoded, dtype=np.int64)
+        states = np.empty((self.size, len(encoded)), dtype=np.int_)
+        place = 1
+        for i, base in enumerate(self.shape):
+            states[i] = (encoded // place) % base
+            place *= base
+        return states.T
+
     def encode(self, state):
         """
         Encode a state as an integer.
@@ -2,9 +2,10 @@
 import unittest
 import numpy as np
 from neet.python import long
-from neet.boolean import BooleanNetwork, LogicNetwork
+from neet.boolean import BooleanNetwork, LogicNetwork, SensitivityMixin
+from neet.boolean.examples import myeloid, mouse_cortical_7B, il_6_signaling
 from neet.exceptions import FormatError
-from neet import Network
+from neet import Network, LandscapeMixin
 from os.path import dirname, abspath, realpath, join
 
 
@@ -282,6 +283,36 @@ class TestLogicNetwork(unittest.TestCase):
         self.assertTrue(net.is_dependent(2, 0))
         self.assertTrue(net.is_dependent(2, 1))
 
+    def test_is_canalizing(self):
+        net = LogicNetwork([((1, 2), {'01', '10'}),
+                            ((0, 2), {'01', '10', '11'}),
+                            ((0, 1), {'11'}),
+                            ((3,), {'0'})])
+
+        self.assertFalse(net.is_canalizing(0, 1))
+        self.assertTrue(net.is_canalizing(1, 0))
+        self.assertTrue(net.is_canalizing(2, 1))
+        self.assertTrue(net.is_canalizing(3, 3))
+        self.assertIsNone(net.is_canalizing(0, 3))
+        self.assertIsNone(net.is_canalizing(4, 0))
+
+    def test_is_canalizing_matches_sensitivity_mixin(self):
+        for net in [myeloid, mouse_cortical_7B, il_6_signaling]:
+            for x in range(net.size):
+                for y in net.neighbors_in(x):
+                    self.assertEqual(net.is_canalizing(x, y),
+                                     SensitivityMixin.is_canalizing(net, x, y))
+
+    def test_transitions_matches_landscape_mixin(self):
+        constant = LogicNetwork([((), {''}), ((0, 1), {'01', '10'})])
+        overlong = LogicNetwork([((0,), {'01'}), ((0, 1), {(1, 0)})])
+        for net in [myeloid, mouse_cortical_7B, constant, overlong]:
+            for kwargs in [{}, {'index': 1}, {'pin': [0, 1]},
+                           {'values': {0: 0, 1: 1}}]:
+                self.assertTrue(np.array_equal(
+                    net._unsafe_transitions(**kwargs),
+                    LandscapeMixin._unsafe_transitions(net, **kwargs)))
+
     def test_reduce_table(self):
         table = [((1, 2), {'11', '10'}),
                  ((0,), {'1'}),
@@ -170,6 +170,39 @@ class TestStateSpace(unittest.TestCase):
                         decoded = space.decode(encoded)
                         self.assertEqual(state, decoded)
 
+    def test_batch_encode_uniform(self):
+        for width in range(1, 5):
+            for base in range(1, 5):
+                space = StateSpace([base] * width)
+                encoded = space._unsafe_batch_encode(list(space))
+                self.assertEqual(list(range(space.volume)), list(encoded))
+
+    def test_batch_encode_nonuniform(self):
+        for a in range(1, 5):
+            for b in range(1, 5):
+                for c in range(1, 5):
+                    space = StateSpace([a, b, c])
+                    states = np.asarray(list(space))
+                    encoded = space._unsafe_batch_encode(states)
+                    self.assertEqual(list(map(space.encode, space)), list(encoded))
+
+    def test_batch_decode_uniform(self):
+        for width in range(1, 5):
+            for base in range(1, 5):
+                space = StateSpace([base] * width)
+                decoded = space._unsafe_batch_decode(range(space.volume))
+                self.assertEqual(list(space), decoded.tolist())
+
+    def test_batch_decode_nonuniform(self):
+        for a in range(1, 5):
+            for b in range(1, 5):
+                for c in range(1, 5):
+                    space = StateSpace([a, b, c])
+                    encoded = np.arange(space.volume)
+                    decoded = space._unsafe_batch_decode(encoded)
+                    self.assertEqual(list(map(space.decode, encoded)), decoded.tolist())
+                    self.assertEqual(list(encoded), list(space._unsafe_batch_encode(decoded)))
+
     def test_decode_encode_uniform(self):
         for width in range(1, 5):
             for base in range(1, 5):
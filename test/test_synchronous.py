@@ -432,6 +432,7 @@ class TestLandscape(unittest.TestCase):
                     (ECA(110, 6), 1.469012)]
 
         for net, entropy in networks:
+            self.assertIsInstance(net.basin_entropy, float)
             self.assertAlmostEqual(entropy, net.basin_entropy, places=6)
 
     def test_basin_entropy_wtnetwork(self):
@@ -473,7 +474,7 @@ class TestLandscape(unittest.TestCase):
         for code in [30, 110, 21, 43]:
             for size in range(2, 7):
                 net = ECA(code, size)
-                in_degrees = np.empty(net.volume, dtype=np.int)
+                in_degrees = np.empty(net.volume, dtype=np.int_)
                 for i in range(net.volume):
                     in_degrees[i] = np.count_nonzero(
                         net.transitions == i)
@@ -481,7 +482,7 @@ class TestLandscape(unittest.TestCase):
                 self.assertEqual(list(in_degrees), list(net.in_degrees))
 
         for net in [s_pombe, s_cerevisiae, c_elegans]:
-            in_degrees = np.empty(net.volume, dtype=np.int)
+            in_degrees = np.empty(net.volume, dtype=np.int_)
             for i in range(net.volume):
                 in_degrees[i] = np.count_nonzero(net.transitions == i)
             net.clear_landscape()